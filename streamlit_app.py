@@ -1,23 +1,12 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 import sys
-import glob
 import time
 from pathlib import Path
 import subprocess
-from typing import List, Tuple, Optional
-
-# Import the transcription processor functions
-# Note: This assumes transcription_processor.py is in the same directory
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from transcription_processor import (
-    discover_xml_files_and_speakers,
-    build_chronological_word_dictionary,
-    create_turns_with_gap_logic,
-    merge_cross_talk_turns,
-    write_turns_to_csv
-)
+from typing import Dict, List, Sequence, Tuple, Optional
 
 # Page configuration
 st.set_page_config(
@@ -86,16 +75,26 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
-# Initialize Tkinter for file dialog (hidden window)
+def has_display() -> bool:
+    """Check whether a GUI display is available (headless Linux servers have no DISPLAY)"""
+    if sys.platform.startswith('linux'):
+        return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return True
+
+# Initialize Tkinter for file dialog (hidden window), only when first needed
 @st.cache_resource
 def init_tkinter():
+    import tkinter as tk
     root = tk.Tk()
     root.withdraw()  # Hide the main window
     return root
 
 def select_directory_dialog():
-    """Open a directory selection dialog"""
+    """Open a directory selection dialog (returns None on headless deployments)"""
+    if not has_display():
+        return None
     try:
+        from tkinter import filedialog
         root = init_tkinter()
         # Force the dialog to appear on top
         root.attributes('-topmost', True)
@@ -106,31 +105,145 @@ def select_directory_dialog():
         st.error(f"Error opening directory dialog: {e}")
         return None
 
-# Initialize Tkinter for file dialog (hidden window)
+@st.cache_data
+def _common_paths(current_dir: str) -> List[Tuple[str, str]]:
+    """Common quick-select directories (computed once per working directory)"""
+    home = os.path.expanduser("~")
+    return [
+        ("Current Directory", current_dir),
+        ("Home Directory", home),
+        ("Desktop", os.path.join(home, "Desktop")),
+        ("Documents", os.path.join(home, "Documents")),
+        ("Downloads", os.path.join(home, "Downloads")),
+    ]
+
+# Import the transcription processor lazily, on first use
+# Note: This assumes transcription_processor.py is in the same directory
 @st.cache_resource
-def init_tkinter():
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    return root
+def _procmod():
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import transcription_processor
+    return transcription_processor
 
-def select_directory_dialog():
-    """Open a directory selection dialog"""
+@st.cache_data(ttl=60)
+def list_xml_files(directory: str, mtime: float) -> List[str]:
+    """List non-hidden XML filenames in a directory (cached until the directory mtime changes)"""
+    with os.scandir(directory) as it:
+        # Skip hidden files (e.g. macOS "._" AppleDouble files), as glob did
+        return sorted(e.name for e in it
+                      if e.is_file() and e.name.endswith('.xml') and not e.name.startswith('.'))
+
+def get_xml_files(directory: str) -> List[str]:
+    """Return the cached XML listing for a directory (empty if it cannot be read)"""
     try:
-        root = init_tkinter()
-        # Force the dialog to appear on top
-        root.attributes('-topmost', True)
-        root.after_idle(root.attributes, '-topmost', False)
-        directory = filedialog.askdirectory(parent=root, title="Select Directory Containing XML Files")
-        return directory if directory else None
-    except Exception as e:
-        st.error(f"Error opening directory dialog: {e}")
-        return None
+        return list_xml_files(directory, os.stat(directory).st_mtime)
+    except OSError:
+        # e.g. PermissionError on privacy-protected folders, as glob did
+        return []
+
+def index_speaker_files(directory: str) -> Dict[str, str]:
+    """Map speaker IDs to their XML file (e.g. *.A.xml) in one pass over the cached listing"""
+    speaker_files = {}
+    for name in get_xml_files(directory):
+        parts = name.rsplit('.', 2)
+        if len(parts) == 3:
+            speaker_files.setdefault(parts[1], os.path.join(directory, name))
+    return speaker_files
+
+@st.cache_data(ttl=60)
+def resolve_pairs(directory: str, speakers: Optional[Tuple[str, ...]], mtime: float) -> List[Tuple[str, str]]:
+    """Resolve (file_path, speaker_id) pairs, shared by the preview and processing paths"""
+    if speakers:
+        speaker_files = index_speaker_files(directory)
+        return [(speaker_files[speaker], speaker) for speaker in speakers if speaker in speaker_files]
+    return _procmod().discover_xml_files_and_speakers(directory)
+
+def get_file_speaker_pairs(directory: str, speakers_list: Optional[List[str]]) -> List[Tuple[str, str]]:
+    """Return the cached file-speaker pairs for a directory and optional speaker list"""
+    speakers = tuple(speakers_list) if speakers_list else None
+    try:
+        mtime = os.stat(directory).st_mtime
+    except OSError:
+        return []
+    return resolve_pairs(directory, speakers, mtime)
+
+def make_pairs_key(file_speaker_pairs: List[Tuple[str, str]]) -> Tuple[Tuple[str, str, int], ...]:
+    """Build a cache key from file-speaker pairs and file mtimes so edits invalidate cached results"""
+    return tuple(
+        (file_path, speaker, os.stat(file_path).st_mtime_ns)
+        for file_path, speaker in file_speaker_pairs
+    )
+
+# Timelines and turn lists are large, so only the most recent few are kept
+@st.cache_data(max_entries=4)
+def load_words(pairs_key: Tuple[Tuple[str, str, int], ...]) -> Tuple[Sequence[float], Sequence[int], List[str], List[str]]:
+    """Extract words from the XML files (cached per file set and mtimes)"""
+    return _procmod().build_chronological_word_dictionary([(file_path, speaker) for file_path, speaker, _ in pairs_key])
+
+@st.cache_data(max_entries=16)
+def build_turns(pairs_key: Tuple[Tuple[str, str, int], ...], gap_threshold: float,
+                split_parameter: Optional[int] = None) -> List[Tuple[str, str, float, float]]:
+    """Create turns from the cached words, merging short turns when split_parameter is given"""
+    if split_parameter is None:
+        return _procmod().create_turns_with_gap_logic(load_words(pairs_key), gap_threshold)
+    return _procmod().merge_cross_talk_turns(build_turns(pairs_key, gap_threshold), split_parameter)
+
+def turns_to_dataframe(turns: List[Tuple[str, str, float, float]]) -> pd.DataFrame:
+    """
+    Build the transcript DataFrame column-wise with explicit compact dtypes.
+    
+    Speaker is categorical and timings are float32, which shrinks both session
+    state and the Arrow payload sent by st.dataframe.
+    """
+    speakers, texts, onsets, offsets = zip(*turns) if turns else ((), (), (), ())
+    return pd.DataFrame({
+        'Speaker': pd.Categorical(speakers),
+        'Text': list(texts),
+        'Onset Time': np.asarray(onsets, dtype=np.float32),
+        'Offset Time': np.asarray(offsets, dtype=np.float32)
+    })
+
+def build_files_preview(file_speaker_pairs: List[Tuple[str, str]]) -> pd.DataFrame:
+    """Build the Speaker/File preview table column-wise"""
+    file_paths, speakers = zip(*file_speaker_pairs)
+    return pd.DataFrame({
+        "Speaker": pd.Categorical(speakers),
+        "File": [os.path.basename(file_path) for file_path in file_paths]
+    })
+
+# Column layout for turn tables; timings are formatted by the frontend
+TURN_COLUMN_CONFIG = {
+    "Text": st.column_config.TextColumn(
+        "Text",
+        width="large",
+        help="Turn text content"
+    ),
+    "Speaker": st.column_config.TextColumn(
+        "Speaker",
+        width="small"
+    ),
+    "Onset Time": st.column_config.NumberColumn(
+        "Onset Time",
+        width="small",
+        format="%.2fs"
+    ),
+    "Offset Time": st.column_config.NumberColumn(
+        "Offset Time",
+        width="small",
+        format="%.2fs"
+    )
+}
+
+# Number of turns per page in the "View All Turns" table
+TURNS_PAGE_SIZE = 500
 
 # Initialize session state
 if 'transcription_complete' not in st.session_state:
     st.session_state.transcription_complete = False
 if 'transcript_data' not in st.session_state:
     st.session_state.transcript_data = None
+if 'csv_bytes' not in st.session_state:
+    st.session_state.csv_bytes = None
 if 'processing' not in st.session_state:
     st.session_state.processing = False
 if 'directory' not in st.session_state:
@@ -148,13 +261,7 @@ st.sidebar.subheader("Directory Selection")
 
 # Create a modern, single-line directory selector with common paths
 current_dir = os.getcwd()
-common_paths = [
-    ("Current Directory", current_dir),
-    ("Home Directory", os.path.expanduser("~")),
-    ("Desktop", os.path.join(os.path.expanduser("~"), "Desktop")),
-    ("Documents", os.path.join(os.path.expanduser("~"), "Documents")),
-    ("Downloads", os.path.join(os.path.expanduser("~"), "Downloads")),
-]
+common_paths = _common_paths(current_dir)
 
 # Add quick select for common directories
 selected_path = st.sidebar.selectbox(
@@ -170,11 +277,12 @@ directory = st.sidebar.text_input(
     value=selected_path if selected_path else st.session_state.directory,
     help="Directory containing XML files"
 )
+dir_exists = bool(directory) and os.path.isdir(directory)
 
 # Directory validation and status
-if directory and os.path.exists(directory):
+if dir_exists:
     # Count XML files in directory
-    xml_files = glob.glob(os.path.join(directory, "*.xml"))
+    xml_files = get_xml_files(directory)
     if xml_files:
         st.sidebar.success(f"✅ {len(xml_files)} XML files found")
     else:
@@ -239,40 +347,24 @@ process_button = st.sidebar.button(
 # Status display
 status_container = st.sidebar.container()
 
-# Main content area
-col1, col2 = st.columns([3, 1])
-
-# File discovery preview
-with col2:
-    st.subheader("Found Files")
-    
-    if os.path.exists(directory):
+def render_file_preview(directory: str, dir_exists: bool, speakers_list: Optional[List[str]]):
+    """Render the found-files table"""
+    if dir_exists:
         if speakers_list:
             # Show specified speakers and their files
-            file_speaker_pairs = []
-            for speaker in speakers_list:
-                pattern = os.path.join(directory, f"*.{speaker}.xml")
-                matches = glob.glob(pattern)
-                if matches:
-                    file_speaker_pairs.append((matches[0], speaker))
+            file_speaker_pairs = get_file_speaker_pairs(directory, speakers_list)
             
             if file_speaker_pairs:
-                preview_df = pd.DataFrame([
-                    {"Speaker": speaker, "File": os.path.basename(file_path)}
-                    for file_path, speaker in file_speaker_pairs
-                ])
+                preview_df = build_files_preview(file_speaker_pairs)
                 st.dataframe(preview_df, hide_index=True, use_container_width=True)
             else:
                 st.warning("No XML files found for specified speakers")
         else:
             # Auto-discover files
             try:
-                file_speaker_pairs = discover_xml_files_and_speakers(directory)
+                file_speaker_pairs = get_file_speaker_pairs(directory, speakers_list)
                 if file_speaker_pairs:
-                    preview_df = pd.DataFrame([
-                        {"Speaker": speaker, "File": os.path.basename(file_path)}
-                        for file_path, speaker in file_speaker_pairs
-                    ])
+                    preview_df = build_files_preview(file_speaker_pairs)
                     st.dataframe(preview_df, hide_index=True, use_container_width=True)
                 else:
                     st.info("No XML files found in directory")
@@ -281,10 +373,77 @@ with col2:
     else:
         st.error("Directory does not exist")
 
+def render_page(df: pd.DataFrame, page_size: int = TURNS_PAGE_SIZE):
+    """Render one page of turns so only the visible window is sent to the frontend"""
+    page_count = max(1, -(-len(df) // page_size))
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="turns_page")
+    start = (page - 1) * page_size
+    end = min(start + page_size, len(df))
+    st.caption(f"Showing turns {start + 1}-{end} of {len(df)}")
+    st.dataframe(
+        df.iloc[start:end], 
+        hide_index=True, 
+        use_container_width=True,
+        column_config=TURN_COLUMN_CONFIG
+    )
+
+@st.fragment
+def render_results():
+    """Render the stats, turn tables and download button for the stored transcript"""
+    st.subheader("Conversation Turns")
+    
+    # Display summary statistics
+    col_stats1, col_stats2, col_stats3 = st.columns(3)
+    with col_stats1:
+        st.metric("Total Turns", len(st.session_state.transcript_data))
+    with col_stats2:
+        speakers = st.session_state.transcript_data['Speaker'].unique()
+        st.metric("Speakers", len(speakers))
+    with col_stats3:
+        avg_words = st.session_state.transcript_data['Text'].str.count(r'\S+').mean()
+        st.metric("Avg Words/Turn", f"{avg_words:.1f}")
+    
+    # Preview first few turns
+    st.markdown("**Preview of first 10 turns:**")
+    full_df = st.session_state.transcript_data
+    preview_df = full_df.head(10)
+    
+    # Configure column widths for better text display
+    st.dataframe(
+        preview_df, 
+        hide_index=True, 
+        use_container_width=True,
+        column_config=TURN_COLUMN_CONFIG
+    )
+    
+    # Full data view (rendered only when toggled on, one page at a time)
+    if st.toggle("View All Turns"):
+        render_page(full_df)
+    
+    # Download button
+    st.download_button(
+        label="📥 Download CSV",
+        data=st.session_state.csv_bytes,
+        file_name="conversation_turns.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
+
+# Main content area
+col1, col2 = st.columns([3, 1])
+
+# File discovery preview
+with col2:
+    st.subheader("Found Files")
+    render_file_preview(directory, dir_exists, speakers_list)
+
 # Processing logic
 if process_button and not st.session_state.processing:
     st.session_state.processing = True
     st.session_state.transcription_complete = False
+    st.session_state.pop('turns_page', None)
     
     # Clear previous results
     with col1:
@@ -295,21 +454,16 @@ if process_button and not st.session_state.processing:
     
     try:
         # Validate directory
-        if not os.path.exists(directory):
+        if not dir_exists:
             raise FileNotFoundError(f"Directory '{directory}' does not exist")
         
         # Get file-speaker pairs
+        file_speaker_pairs = get_file_speaker_pairs(directory, speakers_list)
         if speakers_list:
-            file_speaker_pairs = []
+            found_speakers = {speaker for _, speaker in file_speaker_pairs}
             for speaker in speakers_list:
-                pattern = os.path.join(directory, f"*.{speaker}.xml")
-                matches = glob.glob(pattern)
-                if matches:
-                    file_speaker_pairs.append((matches[0], speaker))
-                else:
+                if speaker not in found_speakers:
                     st.warning(f"No XML file found for speaker {speaker}")
-        else:
-            file_speaker_pairs = discover_xml_files_and_speakers(directory)
         
         if not file_speaker_pairs:
             raise ValueError("No XML files found!")
@@ -328,7 +482,8 @@ if process_button and not st.session_state.processing:
         step_text.text("Step 1/4: Extracting words from XML files...")
         progress_bar.progress(25)
         
-        word_dict = build_chronological_word_dictionary(file_speaker_pairs)
+        # Words are loaded (or taken from the cache) by build_turns only when its own result isn't cached
+        pairs_key = make_pairs_key(file_speaker_pairs)
         
         # Step 2: Create turns
         with status_container:
@@ -337,7 +492,7 @@ if process_button and not st.session_state.processing:
         step_text.text(f"Step 2/4: Creating turns (gap threshold: {gap_threshold}s)...")
         progress_bar.progress(50)
         
-        turns = create_turns_with_gap_logic(word_dict, gap_threshold)
+        turns = build_turns(pairs_key, gap_threshold)
         
         # Step 3: Merge turns (optional)
         if enable_merging:
@@ -347,7 +502,7 @@ if process_button and not st.session_state.processing:
             step_text.text("Step 3/4: Merging short consecutive turns...")
             progress_bar.progress(75)
             
-            turns = merge_cross_talk_turns(turns, split_parameter)
+            turns = build_turns(pairs_key, gap_threshold, split_parameter)
         else:
             progress_bar.progress(75)
         
@@ -359,10 +514,21 @@ if process_button and not st.session_state.processing:
         progress_bar.progress(90)
         
         output_file = os.path.join(directory, "conversation_turns.csv")
-        write_turns_to_csv(turns, output_file)
+        written = _procmod().write_turns_to_csv(turns, output_file)
+        
+        # Serve the download straight from the written file; a failed write
+        # must not serve a stale file, so serialize the turns the same way instead
+        csv_bytes = None
+        if written:
+            try:
+                with open(output_file, 'rb') as f:
+                    csv_bytes = f.read()
+            except OSError:
+                pass
+        st.session_state.csv_bytes = csv_bytes or _procmod().turns_to_csv_bytes(turns)
         
         # Convert to DataFrame for display
-        df = pd.DataFrame(turns, columns=['Speaker', 'Text', 'Onset Time', 'Offset Time'])
+        df = turns_to_dataframe(turns)
         st.session_state.transcript_data = df
         st.session_state.transcription_complete = True
         
@@ -371,7 +537,10 @@ if process_button and not st.session_state.processing:
         
         with status_container:
             st.markdown('<p class="status-success">✅ Processing complete!</p>', unsafe_allow_html=True)
-            st.info(f"Results saved to: {output_file}")
+            if written:
+                st.info(f"Results saved to: {output_file}")
+            else:
+                st.warning(f"Could not write {output_file}; the download is generated from the results instead")
             st.info(f"Total turns created: {len(turns)}")
         
     except Exception as e:
@@ -387,92 +556,7 @@ if process_button and not st.session_state.processing:
 # Display results
 with col1:
     if st.session_state.transcription_complete and st.session_state.transcript_data is not None:
-        st.subheader("Conversation Turns")
-        
-        # Display summary statistics
-        col_stats1, col_stats2, col_stats3 = st.columns(3)
-        with col_stats1:
-            st.metric("Total Turns", len(st.session_state.transcript_data))
-        with col_stats2:
-            speakers = st.session_state.transcript_data['Speaker'].unique()
-            st.metric("Speakers", len(speakers))
-        with col_stats3:
-            avg_words = st.session_state.transcript_data['Text'].str.split().str.len().mean()
-            st.metric("Avg Words/Turn", f"{avg_words:.1f}")
-        
-        # Preview first few turns
-        st.markdown("**Preview of first 10 turns:**")
-        preview_df = st.session_state.transcript_data.head(10).copy()
-        
-        # Format timing for better readability
-        preview_df['Onset Time'] = preview_df['Onset Time'].astype(float).apply(lambda x: f"{x:.2f}s")
-        preview_df['Offset Time'] = preview_df['Offset Time'].astype(float).apply(lambda x: f"{x:.2f}s")
-        
-        # Configure column widths for better text display
-        st.dataframe(
-            preview_df, 
-            hide_index=True, 
-            use_container_width=True,
-            column_config={
-                "Text": st.column_config.TextColumn(
-                    "Text",
-                    width="large",
-                    help="Turn text content"
-                ),
-                "Speaker": st.column_config.TextColumn(
-                    "Speaker",
-                    width="small"
-                ),
-                "Onset Time": st.column_config.TextColumn(
-                    "Onset Time",
-                    width="small"
-                ),
-                "Offset Time": st.column_config.TextColumn(
-                    "Offset Time",
-                    width="small"
-                )
-            }
-        )
-        
-        # Full data view
-        with st.expander("View All Turns"):
-            full_df = st.session_state.transcript_data.copy()
-            full_df['Onset Time'] = full_df['Onset Time'].astype(float).apply(lambda x: f"{x:.2f}s")
-            full_df['Offset Time'] = full_df['Offset Time'].astype(float).apply(lambda x: f"{x:.2f}s")
-            st.dataframe(
-                full_df, 
-                hide_index=True, 
-                use_container_width=True,
-                column_config={
-                    "Text": st.column_config.TextColumn(
-                        "Text",
-                        width="large",
-                        help="Turn text content"
-                    ),
-                    "Speaker": st.column_config.TextColumn(
-                        "Speaker",
-                        width="small"
-                    ),
-                    "Onset Time": st.column_config.TextColumn(
-                        "Onset Time",
-                        width="small"
-                    ),
-                    "Offset Time": st.column_config.TextColumn(
-                        "Offset Time",
-                        width="small"
-                    )
-                }
-            )
-        
-        # Download button
-        csv = st.session_state.transcript_data.to_csv(index=False)
-        st.download_button(
-            label="📥 Download CSV",
-            data=csv,
-            file_name="conversation_turns.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
+        render_results()
     
     elif not st.session_state.processing:
         st.info("Configure settings in the sidebar and click 'Start Processing' to begin.")
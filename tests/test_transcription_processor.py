@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree
+from unittest import mock
+
+import transcription_processor as tp
+
+
+def _timeline(times, speaker_ids, words, speakers):
+    if tp.HAS_NUMPY:
+        times = tp.np.array(times, dtype=tp.np.float64)
+        speaker_ids = tp.np.array(speaker_ids, dtype=tp.np.int64)
+    return tp.WordTimeline(times, speaker_ids, words, speakers)
+
+
+class ZeroWordSpeakerTest(unittest.TestCase):
+    """A speaker whose file produced no words must not break turn building."""
+
+    def setUp(self):
+        # Speaker B has no words at all
+        self.timeline = _timeline([0.0, 0.5, 3.0], [0, 0, 2], ["hello", "there", "hi"], ["A", "B", "C"])
+        self.expected = [("A", "hello there", 0.0, 0.5), ("C", "hi", 3.0, 3.0)]
+
+    def _merged(self, speaker_turns):
+        return sorted(turn for turns in speaker_turns for turn in turns)
+
+    def test_python(self):
+        self.assertEqual(self._merged(tp._create_turns_python(self.timeline, 1.0)), self.expected)
+
+    @unittest.skipUnless(tp.HAS_NUMPY, "numpy not installed")
+    def test_numpy(self):
+        self.assertEqual(self._merged(tp._create_turns_numpy(self.timeline, 1.0)), self.expected)
+
+    @unittest.skipUnless(tp.HAS_NUMBA, "numba not installed")
+    def test_numba(self):
+        self.assertEqual(tp._create_turns_numba(self.timeline, 1.0), self.expected)
+
+
+class ParserParityTest(unittest.TestCase):
+    """The lxml and standard library parsers must extract the same words."""
+
+    FILES = {
+        # Nested <w> elements, tail text after a child and punctuation are not words
+        'mixed.A.xml': (
+            '<nite:root xmlns:nite="http://nite.sourceforge.net/">'
+            '<w starttime="0.5">it&#39;s</w><g><w starttime="0.7">nested</w></g>'
+            '<w starttime="1.0"><sub/>tail</w><w starttime="1.2" punc="true">.</w>'
+            '<w starttime="">untimed</w><w starttime="1.5">there</w></nite:root>'
+        ),
+        # Truncated file: nothing is extracted
+        'truncated.B.xml': '<nite:root xmlns:nite="http://nite.sourceforge.net/"><w starttime="0.1">a</w><w starttime="0.2">b',
+    }
+    EXPECTED = {
+        'mixed.A.xml': ([0.5, 1.5], ["it's", "there"]),
+        'truncated.B.xml': ([], []),
+    }
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, content in self.FILES.items():
+            with open(os.path.join(self.tmp.name, name), 'w', encoding='utf-8') as f:
+                f.write(content)
+
+    def _extract(self, name):
+        times, words = tp.extract_words_from_xml(os.path.join(self.tmp.name, name))
+        return [float(t) for t in times], words
+
+    def test_default_parser(self):
+        for name, expected in self.EXPECTED.items():
+            with self.subTest(name=name):
+                self.assertEqual(self._extract(name), expected)
+
+    def test_stdlib_parser(self):
+        with mock.patch.object(tp, 'HAS_LXML', False), mock.patch.object(tp, 'ET', xml.etree.ElementTree):
+            for name, expected in self.EXPECTED.items():
+                with self.subTest(name=name):
+                    self.assertEqual(self._extract(name), expected)
+
+
+class DuplicatePairTest(unittest.TestCase):
+    """Repeating a speaker (e.g. "A,A") must not duplicate their words."""
+
+    def test_repeated_pair(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'meeting.A.xml')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('<root><w starttime="0.5">hello</w><w starttime="0.9">world</w></root>')
+            timeline = tp.build_chronological_word_dictionary([(path, 'A'), (path, 'A')])
+        self.assertEqual(timeline.words, ['hello', 'world'])
+        self.assertEqual(timeline.speakers, ['A'])
+
+
+if __name__ == '__main__':
+    unittest.main()
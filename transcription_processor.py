@@ -16,18 +16,83 @@ Arguments:
     speakers: Comma-separated list of speakers (e.g., "A,B,C,D") 
     gap_threshold: Silence gap in seconds to end a turn (default: 1.0)
 
+Environment:
+    LOGLEVEL: Logging level (default: INFO); DEBUG shows per-file progress,
+        ERROR hides warnings
+
 Output:
     CSV file with columns: speaker, text, onset_time, offset_time
+
+Optional dependencies:
+    lxml: faster XML parsing (falls back to xml.etree.ElementTree)
+    numpy: vectorized turn construction (falls back to pure Python)
+    numba: JIT-compiled turn construction for very large inputs (requires numpy)
 """
 
-import re
 import os
 import sys
 import glob
 import csv
-import xml.etree.ElementTree as ET
 import html
-from typing import Dict, List, Tuple, Optional
+import importlib.util
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from heapq import merge
+from itertools import islice, repeat
+from operator import itemgetter
+from typing import Iterator, List, NamedTuple, Sequence, Tuple, Optional
+
+# NumPy is optional; it vectorizes turn construction when installed
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Numba is optional; it JIT-compiles the turn-building kernel for very large
+# inputs. It is only imported when first needed, since loading it costs more
+# than it saves at typical meeting sizes.
+HAS_NUMBA = HAS_NUMPY and importlib.util.find_spec('numba') is not None
+
+# Use lxml when available (faster parsing), otherwise fall back to the standard library
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+logger = logging.getLogger(__name__)
+
+# Word count from which the compiled Numba kernel pays for its import and
+# cache load (about 0.3 s) compared with the NumPy path
+_NUMBA_MIN_WORDS = 1_000_000
+
+# Combined input size from which parsing is spread over worker processes;
+# below it, starting the workers costs more than parsing sequentially
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+# Timed word elements that are not punctuation, selected in C by libxml2
+_TIMED_WORDS_XPATH = ET.XPath("/*/w[not(@punc='true') and @starttime != '']") if HAS_LXML else None
+
+
+class WordTimeline(NamedTuple):
+    """
+    All words of a conversation as parallel lists (structure of arrays).
+    
+    Index i describes one word: spoken by speakers[speaker_ids[i]] at times[i].
+    Words are kept in chronological order. Speakers are interned to small
+    integer ids once at load time; speakers maps each id back to its label.
+    times and speaker_ids are NumPy arrays when NumPy is installed.
+    """
+    times: Sequence[float]
+    speaker_ids: Sequence[int]
+    words: List[str]
+    speakers: List[str]
 
 
 def extract_speaker_from_filename(filename: str) -> str:
@@ -40,8 +105,10 @@ def extract_speaker_from_filename(filename: str) -> str:
     Returns:
         Speaker ID (e.g., "A") or None if not found
     """
-    match = re.search(r'\.([A-Z])\.xml$', filename)
-    return match.group(1) if match else None
+    # Fixed-shape suffix check: "<name>.<LETTER>.xml"
+    if len(filename) >= 6 and filename.endswith('.xml') and filename[-6] == '.' and 'A' <= filename[-5] <= 'Z':
+        return filename[-5]
+    return None
 
 
 def discover_xml_files_and_speakers(directory: str) -> List[Tuple[str, str]]:
@@ -54,97 +121,421 @@ def discover_xml_files_and_speakers(directory: str) -> List[Tuple[str, str]]:
     Returns:
         List of (file_path, speaker_id) tuples sorted by speaker
     """
-    xml_files = glob.glob(os.path.join(directory, "*.xml"))
     file_speaker_pairs = []
     
-    for file_path in xml_files:
-        filename = os.path.basename(file_path)
-        speaker_id = extract_speaker_from_filename(filename)
-        if speaker_id:
-            file_speaker_pairs.append((file_path, speaker_id))
+    # Stream directory entries (DirEntry caches file type info, avoiding extra stat calls).
+    # Hidden files are skipped and unreadable directories yield nothing, as glob("*.xml") did.
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                speaker_id = extract_speaker_from_filename(entry.name)
+                if speaker_id and entry.is_file():
+                    file_speaker_pairs.append((entry.path, speaker_id))
+    except OSError:
+        return []
     
     # Sort by speaker ID to ensure consistent order
     file_speaker_pairs.sort(key=lambda x: x[1])
     return file_speaker_pairs
 
 
-def extract_words_from_xml(xml_file_path: str, speaker_id: str) -> Dict[float, str]:
+def _fast_unescape(text: str) -> str:
+    """
+    Decode HTML entities, skipping html.unescape for text without any '&'.
+    
+    The XML parser already decodes regular entities, so only the rare
+    double-escaped words still contain '&' and need the full decoder.
+    """
+    return html.unescape(text) if '&' in text else text
+
+
+def iter_timed_words(xml_file) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the starttime and text of every timed, non-punctuation <w> element.
+    
+    Only <w> children of the root element are considered. With lxml the
+    filtering is done by a compiled XPath expression, so punctuation elements
+    never cross into Python. Otherwise the file is streamed with iterparse and
+    each element is released once processed, so only the word pairs are kept
+    in memory. Either way nothing is yielded until the whole file has parsed,
+    so a malformed file produces no words.
+    
+    Args:
+        xml_file: Open binary file object for the XML file
+        
+    Yields:
+        (starttime, text) string pairs in document order
+    """
+    if HAS_LXML:
+        for element in _TIMED_WORDS_XPATH(ET.parse(xml_file)):
+            # Checked here rather than with text(), which also matches tail text of children
+            word_text = element.text
+            if word_text:
+                yield element.get('starttime'), word_text
+    else:
+        # Buffered until the parse completes, as the lxml path is
+        pairs = []
+        depth = 0
+        context = ET.iterparse(xml_file, events=('start', 'end'))
+        for event, element in context:
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    root = element
+                continue
+            depth -= 1
+            if depth == 1:
+                # A direct child of the root
+                if element.tag == 'w':
+                    start_time = element.get('starttime')
+                    word_text = element.text
+                    # Process only actual words (not punctuation marks)
+                    if start_time and word_text and element.get('punc') != 'true':
+                        pairs.append((start_time, word_text))
+                # Drop processed children from the root
+                root.clear()
+        yield from pairs
+
+
+def extract_words_from_xml(xml_file_path: str) -> Tuple[Sequence[float], List[str]]:
     """
     Extract words and their timestamps from a single XML file.
     
-    This function parses XML files containing <w> elements with timestamp information
+    This function reads XML files containing <w> elements with timestamp information
     and extracts word content, preserving the exact timing of each word.
     
     Args:
         xml_file_path: Path to the XML file
-        speaker_id: Speaker identifier (e.g., "A", "B", etc.)
         
     Returns:
-        Dictionary mapping timestamp to "speaker:word" string
+        Tuple of (timestamps, words) in file order; timestamps are a float64
+        array when NumPy is installed, otherwise a list of floats
     """
-    word_timestamps = {}
+    times = []
+    words = []
     
     try:
-        # Parse the XML file
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
-        
-        # Define namespace for NITE XML format
-        namespace = {'nite': 'http://nite.sourceforge.net/'}
-        
-        # Find all word elements, excluding punctuation and vocal sounds
-        for word_element in root.findall('w', namespace):
-            start_time = word_element.get('starttime')
-            word_text = word_element.text
-            is_punctuation = word_element.get('punc') == 'true'
-            
-            # Process only actual words (not punctuation marks)
-            if start_time and word_text and not is_punctuation:
-                timestamp = float(start_time)
+        with open(xml_file_path, 'rb') as xml_file:
+            # Word elements, excluding punctuation and vocal sounds
+            for start_time, word_text in iter_timed_words(xml_file):
+                # With NumPy the strings are converted in one batch below
+                start = start_time if HAS_NUMPY else float(start_time)
                 # Decode HTML entities (e.g., &#39; -> ')
-                clean_word = html.unescape(word_text.strip())
-                # Store in format "speaker:word" 
-                word_timestamps[timestamp] = f"{speaker_id}:{clean_word}"
+                word = _fast_unescape(word_text.strip())
+                # Append only once both are known, so the lists stay aligned
+                times.append(start)
+                words.append(word)
                 
     except ET.ParseError as e:
-        print(f"Warning: XML Parse Error in {xml_file_path}: {e}")
+        logger.warning("XML Parse Error in %s: %s", xml_file_path, e)
     except FileNotFoundError:
-        print(f"Warning: Could not find file {xml_file_path}")
+        logger.warning("Could not find file %s", xml_file_path)
     except Exception as e:
-        print(f"Warning: Error processing {xml_file_path}: {e}")
+        logger.warning("Error processing %s: %s", xml_file_path, e)
+    
+    if HAS_NUMPY:
+        try:
+            times = np.array(times, dtype=np.float64)
+        except ValueError as e:
+            # Keep the words before the first invalid starttime, as the pure-Python path does
+            logger.warning("Error processing %s: %s", xml_file_path, e)
+            valid_times = []
+            for start_time in times:
+                try:
+                    valid_times.append(float(start_time))
+                except ValueError:
+                    break
+            times, words = np.array(valid_times, dtype=np.float64), words[:len(valid_times)]
+    
+    return times, words
+
+
+def extract_all_speaker_words(file_paths: List[str],
+                              max_workers: Optional[int] = None) -> List[Tuple[Sequence[float], List[str]]]:
+    """
+    Extract words from several XML files, parsing them in parallel.
+    
+    Each speaker's file is independent, so large inputs are dispatched to a
+    process pool (processes rather than threads, since parsing holds the GIL).
+    Worker start-up (re-importing this module and its optional dependencies)
+    outweighs the gain for typical meetings, so by default files are parsed
+    sequentially unless their combined size reaches _PARALLEL_MIN_BYTES.
+    Falls back to sequential parsing when the process pool fails.
+    
+    Args:
+        file_paths: XML file paths
+        max_workers: Maximum number of worker processes; None picks
+            automatically, a value above 1 always parses in parallel
+        
+    Returns:
+        List of (timestamps, words) tuples in the same order as file_paths
+    """
+    cpu_count = os.cpu_count() or 1
+    if max_workers is None:
+        try:
+            total_size = sum(os.path.getsize(file_path) for file_path in file_paths)
+        except OSError:
+            total_size = 0
+        if total_size >= _PARALLEL_MIN_BYTES:
+            max_workers = cpu_count
+        else:
+            max_workers = 1
+    workers = min(len(file_paths), max_workers, cpu_count)
+    
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(extract_words_from_xml, file_paths))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.warning("Parallel parsing unavailable (%s), parsing sequentially", e)
     
-    return word_timestamps
+    return [extract_words_from_xml(file_path) for file_path in file_paths]
 
 
-def build_chronological_word_dictionary(file_speaker_pairs: List[Tuple[str, str]]) -> Dict[float, str]:
+def _merge_word_arrays(speaker_words: List[Tuple[Sequence[float], List[str]]],
+                       speaker_ids: List[int], speakers: List[str]) -> WordTimeline:
     """
-    Build a dictionary of all words from all speakers in chronological order.
+    Combine per-speaker timestamp arrays into one chronological timeline with NumPy.
+    
+    A stable argsort on float64 is a timsort, which detects the already-sorted
+    per-speaker runs in the concatenated array and merges them.
+    """
+    times = np.concatenate([times for times, _ in speaker_words] or [np.empty(0)])
+    ids = np.concatenate([
+        np.full(len(times), speaker_id, dtype=np.int64)
+        for (times, _), speaker_id in zip(speaker_words, speaker_ids)
+    ] or [np.empty(0, dtype=np.int64)])
+    all_words = [word for _, words in speaker_words for word in words]
+    
+    order = np.argsort(times, kind='stable')
+    return WordTimeline(times[order], ids[order], [all_words[i] for i in order.tolist()], speakers)
+
+
+def build_chronological_word_dictionary(file_speaker_pairs: List[Tuple[str, str]],
+                                        max_workers: Optional[int] = None) -> WordTimeline:
+    """
+    Build the combined word timeline of all speakers.
     
     This combines words from all speakers into a single timeline, preserving
-    the exact timing of overlapping speech.
+    the exact timing of overlapping speech. Words from different speakers that
+    share a timestamp are all kept.
+    
+    Each speaker's words are already in time order (XML word order), so the
+    per-speaker streams are combined with a K-way merge instead of a global sort.
     
     Args:
         file_speaker_pairs: List of (file_path, speaker_id) tuples
+        max_workers: Maximum number of parser processes (default: automatic,
+            see extract_all_speaker_words)
         
     Returns:
-        Dictionary mapping timestamp to "speaker:word" string for all speakers
+        WordTimeline with the words of all speakers in chronological order
     """
-    combined_word_dict = {}
+    # A repeated pair (e.g. speakers "A,A") must not duplicate every word
+    file_speaker_pairs = list(dict.fromkeys(file_speaker_pairs))
     
-    # Process each speaker's file
     for file_path, speaker_id in file_speaker_pairs:
-        print(f"Processing {speaker_id}: {os.path.basename(file_path)}")
+        logger.debug("Processing %s: %s", speaker_id, os.path.basename(file_path))
+    
+    # Extract words from each speaker's XML file
+    file_paths = [file_path for file_path, _ in file_speaker_pairs]
+    speaker_words = extract_all_speaker_words(file_paths, max_workers)
+    
+    # Intern speaker labels to small integer ids
+    speaker_to_id = {}
+    for _, speaker_id in file_speaker_pairs:
+        speaker_to_id.setdefault(speaker_id, len(speaker_to_id))
+    
+    if HAS_NUMPY:
+        return _merge_word_arrays(speaker_words, [speaker_to_id[s] for _, s in file_speaker_pairs],
+                                  list(speaker_to_id))
+    
+    # One time-ordered (timestamp, speaker id, word) stream per speaker
+    streams = []
+    for (_, speaker_id), (times, words) in zip(file_speaker_pairs, speaker_words):
+        if any(later < earlier for earlier, later in zip(times, times[1:])):
+            # Out-of-order file: sort it so the merge stays correct
+            order = sorted(range(len(times)), key=times.__getitem__)
+            times = [times[i] for i in order]
+            words = [words[i] for i in order]
+        streams.append(zip(times, repeat(speaker_to_id[speaker_id]), words))
+    
+    # Merge the sorted streams into the combined timeline
+    columns = list(zip(*merge(*streams, key=itemgetter(0)))) or [(), (), ()]
+    return WordTimeline(*(list(column) for column in columns), speakers=list(speaker_to_id))
+
+
+def _create_turns_python(timeline: WordTimeline, gap_threshold: float) -> List[List[Tuple[str, str, float, float]]]:
+    """
+    Pure-Python turn construction, used when NumPy is not installed.
+    
+    Walks all words chronologically, tracking the ongoing turn of each speaker
+    in small fixed-size lists indexed by speaker id. Returns one turn list per
+    speaker, each in onset order.
+    """
+    speaker_labels = timeline.speakers
+    
+    speaker_turns = [[] for _ in speaker_labels]
+    # Ongoing turn per speaker: words (None if no turn yet), start and end timestamps.
+    # The end timestamp is also the speaker's last timestamp.
+    turn_words = [None] * len(speaker_labels)
+    turn_start = [0.0] * len(speaker_labels)
+    turn_end = [0.0] * len(speaker_labels)
+    
+    # Process each word in chronological order
+    for timestamp, s, word in zip(timeline.times, timeline.speaker_ids, timeline.words):
+        current_words = turn_words[s]
         
-        # Extract words from this speaker's XML file
-        speaker_words = extract_words_from_xml(file_path, speaker_id)
+        if current_words is None:
+            # No ongoing turn for this speaker - start a new one
+            turn_words[s] = [word]
+            turn_start[s] = timestamp
+        elif timestamp - turn_end[s] > gap_threshold:
+            # Gap is too long - end the current turn and start a new one
+            speaker_turns[s].append((speaker_labels[s], " ".join(current_words), turn_start[s], turn_end[s]))
+            turn_words[s] = [word]
+            turn_start[s] = timestamp
+        else:
+            # Continue the current turn
+            current_words.append(word)
         
-        # Add to combined dictionary
-        combined_word_dict.update(speaker_words)
+        turn_end[s] = timestamp
     
-    return combined_word_dict
+    # Finalize any remaining ongoing turns
+    for s, speaker in enumerate(speaker_labels):
+        if turn_words[s] is not None:
+            speaker_turns[s].append((speaker, " ".join(turn_words[s]), turn_start[s], turn_end[s]))
+    
+    return speaker_turns
+
+
+def _create_turns_numpy(timeline: WordTimeline, gap_threshold: float) -> List[List[Tuple[str, str, float, float]]]:
+    """
+    Vectorized turn construction using NumPy.
+    
+    For each speaker, the word timestamps are taken in chronological order and
+    turn boundaries are the positions where the gap to the previous word
+    exceeds the threshold, so no per-word Python branching is needed.
+    Returns one turn list per speaker, each in onset order.
+    """
+    timestamps = np.asarray(timeline.times, dtype=np.float64)
+    speaker_ids = np.asarray(timeline.speaker_ids, dtype=np.int64)
+    words = timeline.words
+    
+    speaker_turns = []
+    for speaker_index, speaker in enumerate(timeline.speakers):
+        # This speaker's words, already in chronological order
+        word_indices = np.flatnonzero(speaker_ids == speaker_index)
+        if word_indices.size == 0:
+            # No words for this speaker (empty, unreadable or missing file)
+            speaker_turns.append([])
+            continue
+        times = timestamps[word_indices]
+        
+        # Turns are contiguous runs of words between gaps > gap_threshold
+        breaks = np.flatnonzero(np.diff(times) > gap_threshold) + 1
+        starts = np.concatenate(([0], breaks)).tolist()
+        ends = np.concatenate((breaks, [len(times)])).tolist()
+        
+        turns = []
+        for start, end in zip(starts, ends):
+            text = " ".join([words[i] for i in word_indices[start:end].tolist()])
+            turns.append((speaker, text, float(times[start]), float(times[end - 1])))
+        speaker_turns.append(turns)
+    
+    return speaker_turns
+
+
+def _build_turns_kernel(times, speaker_ids, n_speakers, gap_threshold):
+    """
+    Assign every word to a turn in a single pass (compiled with Numba).
+    
+    Per-speaker state is a small array of open turn indices; a speaker's last
+    timestamp is the end of their open turn.
+    Turns are numbered in order of their first word, i.e. by onset time.
+    
+    Args:
+        times: Chronological word timestamps (float64 array)
+        speaker_ids: Speaker index of each word (int64 array)
+        n_speakers: Number of distinct speakers
+        gap_threshold: Gap in seconds to end a turn for the same speaker
+        
+    Returns:
+        Tuple of (word_turns, turn_speakers, turn_starts, turn_ends) arrays
+    """
+    n_words = times.shape[0]
+    word_turns = np.empty(n_words, dtype=np.int64)
+    turn_speakers = np.empty(n_words, dtype=np.int64)
+    turn_starts = np.empty(n_words, dtype=np.float64)
+    turn_ends = np.empty(n_words, dtype=np.float64)
+    current_turn = np.full(n_speakers, -1, dtype=np.int64)
+    n_turns = 0
+    
+    for i in range(n_words):
+        speaker = speaker_ids[i]
+        timestamp = times[i]
+        if current_turn[speaker] < 0 or timestamp - turn_ends[current_turn[speaker]] > gap_threshold:
+            # Start a new turn for this speaker
+            current_turn[speaker] = n_turns
+            turn_speakers[n_turns] = speaker
+            turn_starts[n_turns] = timestamp
+            n_turns += 1
+        turn = current_turn[speaker]
+        turn_ends[turn] = timestamp
+        word_turns[i] = turn
+    
+    return word_turns, turn_speakers[:n_turns], turn_starts[:n_turns], turn_ends[:n_turns]
+
+
+@lru_cache(maxsize=None)
+def _load_numba_kernel():
+    """
+    Import Numba and compile the turn kernel on first use.
+    
+    The kernel is warmed up on a one-word input, so compilation (or loading
+    the on-disk cache) happens here rather than inside the first real call.
+    
+    Returns:
+        The compiled kernel, or None if Numba cannot be imported
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    kernel = njit(cache=True)(_build_turns_kernel)
+    kernel(np.zeros(1, dtype=np.float64), np.zeros(1, dtype=np.int64), 1, 1.0)
+    return kernel
 
 
-def create_turns_with_gap_logic(word_dict: Dict[float, str], gap_threshold: float = 1.0) -> List[Tuple[str, str, float, float]]:
+def _create_turns_numba(timeline: WordTimeline, gap_threshold: float) -> List[Tuple[str, str, float, float]]:
+    """
+    Turn construction using the compiled kernel; words are stitched into text afterwards.
+    
+    The kernel numbers turns by their first word, so the result is already in
+    onset order.
+    """
+    timestamps = np.asarray(timeline.times, dtype=np.float64)
+    speaker_ids = np.asarray(timeline.speaker_ids, dtype=np.int64)
+    word_turns, turn_speakers, turn_starts, turn_ends = _load_numba_kernel()(
+        timestamps, speaker_ids, len(timeline.speakers), float(gap_threshold))
+    
+    # Group word indices by turn (stable, so words stay in time order within a turn)
+    order = np.argsort(word_turns, kind='stable').tolist()
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(word_turns, minlength=len(turn_starts))))).tolist()
+    words = [timeline.words[i] for i in order]
+    
+    labels = timeline.speakers
+    return [
+        (labels[speaker], " ".join(words[bounds[turn]:bounds[turn + 1]]), start, end)
+        for turn, (speaker, start, end) in enumerate(zip(turn_speakers.tolist(),
+                                                         turn_starts.tolist(),
+                                                         turn_ends.tolist()))
+    ]
+
+
+def create_turns_with_gap_logic(timeline: WordTimeline, gap_threshold: float = 1.0) -> List[Tuple[str, str, float, float]]:
     """
     Create conversation turns based on speech gaps within each speaker.
     
@@ -153,72 +544,28 @@ def create_turns_with_gap_logic(word_dict: Dict[float, str], gap_threshold: floa
     than the gap_threshold (default 1 second).
     
     Args:
-        word_dict: Dictionary mapping timestamp to "speaker:word"
+        timeline: Chronological WordTimeline of all words (parallel times/speaker_ids/words lists)
         gap_threshold: Gap in seconds to end a turn for the same speaker
         
     Returns:
         List of (speaker, text, onset_time, offset_time) tuples
     """
-    # Sort timestamps to process words chronologically
-    sorted_timestamps = sorted(word_dict.keys())
-    
-    if not sorted_timestamps:
+    if len(timeline.times) == 0:
         return []
     
-    turns = []
-    # Track the last timestamp and ongoing turn for each speaker
-    speaker_last_timestamp = {}
-    speaker_current_turn = {}  # speaker -> {'words': [], 'start': timestamp, 'end': timestamp}
-    
-    print(f"Creating turns with gap threshold: {gap_threshold} seconds")
-    
-    # Process each word in chronological order
-    for timestamp in sorted_timestamps:
-        speaker_and_word = word_dict[timestamp].split(':', 1)
-        speaker = speaker_and_word[0]
-        word = speaker_and_word[1]
-        
-        # Check if this speaker has an ongoing turn
-        if speaker in speaker_current_turn:
-            # Calculate gap since this speaker's last word
-            gap = timestamp - speaker_last_timestamp[speaker]
-            
-            if gap > gap_threshold:
-                # Gap is too long - end the current turn and start a new one
-                current_turn = speaker_current_turn[speaker]
-                text = " ".join(current_turn['words'])
-                turns.append((speaker, text, current_turn['start'], current_turn['end']))
-                
-                # Start new turn
-                speaker_current_turn[speaker] = {
-                    'words': [word],
-                    'start': timestamp,
-                    'end': timestamp
-                }
-            else:
-                # Continue the current turn
-                speaker_current_turn[speaker]['words'].append(word)
-                speaker_current_turn[speaker]['end'] = timestamp
-        else:
-            # No ongoing turn for this speaker - start a new one
-            speaker_current_turn[speaker] = {
-                'words': [word],
-                'start': timestamp,
-                'end': timestamp
-            }
-        
-        # Update the last timestamp for this speaker
-        speaker_last_timestamp[speaker] = timestamp
+    logger.debug("Creating turns with gap threshold: %s seconds", gap_threshold)
     
-    # Finalize any remaining ongoing turns
-    for speaker, turn_data in speaker_current_turn.items():
-        text = " ".join(turn_data['words'])
-        turns.append((speaker, text, turn_data['start'], turn_data['end']))
+    if HAS_NUMBA and len(timeline.times) >= _NUMBA_MIN_WORDS and _load_numba_kernel() is not None:
+        return _create_turns_numba(timeline, gap_threshold)
     
-    # Sort turns by start time to maintain chronological order in output
-    turns.sort(key=lambda x: x[2])
+    if HAS_NUMPY:
+        speaker_turns = _create_turns_numpy(timeline, gap_threshold)
+    else:
+        speaker_turns = _create_turns_python(timeline, gap_threshold)
     
-    return turns
+    # Each speaker's turns are already in onset order, so a K-way merge
+    # yields chronological output without a full sort
+    return list(merge(*speaker_turns, key=itemgetter(2)))
 
 
 def merge_cross_talk_turns(turns: List[Tuple[str, str, float, float]], 
@@ -240,58 +587,81 @@ def merge_cross_talk_turns(turns: List[Tuple[str, str, float, float]],
         return []
     
     merged_turns = []
-    current_turn = turns[0]
+    # Collect the texts of the current merged group and join them once on flush
+    current_speaker, current_text, current_onset, current_offset = turns[0]
+    current_texts = [current_text]
+    current_word_count = len(current_text.split())
     
-    for next_turn in turns[1:]:
-        current_speaker, current_text, current_onset, current_offset = current_turn
-        next_speaker, next_text, next_onset, next_offset = next_turn
+    for next_speaker, next_text, next_onset, next_offset in islice(turns, 1, None):
+        next_word_count = len(next_text.split())
         
         # Check if we should merge consecutive turns from the same speaker
         if (current_speaker == next_speaker and 
-            len(current_text.split()) <= split_parameter and 
-            len(next_text.split()) <= split_parameter):
+            current_word_count <= split_parameter and 
+            next_word_count <= split_parameter):
             
             # Merge the turns
-            merged_text = current_text + " " + next_text
-            merged_turn = (current_speaker, merged_text, current_onset, next_offset)
-            current_turn = merged_turn
+            current_texts.append(next_text)
+            current_word_count += next_word_count
+            current_offset = next_offset
         else:
             # Can't merge - add current turn to results and move to next
-            merged_turns.append(current_turn)
-            current_turn = next_turn
+            merged_turns.append((current_speaker, " ".join(current_texts), current_onset, current_offset))
+            current_speaker, current_onset, current_offset = next_speaker, next_onset, next_offset
+            current_texts = [next_text]
+            current_word_count = next_word_count
     
     # Add the final turn
-    merged_turns.append(current_turn)
+    merged_turns.append((current_speaker, " ".join(current_texts), current_onset, current_offset))
     
     return merged_turns
 
 
+def _write_turn_rows(csvfile, turns: List[Tuple[str, str, float, float]]) -> None:
+    """Write the CSV header and one row per turn, streaming rows instead of building a list."""
+    writer = csv.writer(csvfile)
+    writer.writerow(['speaker', 'text', 'onset_time', 'offset_time'])
+    writer.writerows(
+        (speaker, text, f"{onset_time:.2f}", f"{offset_time:.2f}")
+        for speaker, text, onset_time, offset_time in turns
+    )
+
+
 def write_turns_to_csv(turns: List[Tuple[str, str, float, float]], 
-                       output_file: str = "conversation_turns.csv") -> None:
+                       output_file: str = "conversation_turns.csv") -> bool:
     """
     Write conversation turns to a CSV file with timing information.
     
     Args:
         turns: List of (speaker, text, onset_time, offset_time) tuples
         output_file: Output CSV filename
+        
+    Returns:
+        True if the file was written, False if writing failed
     """
-    # Prepare data for CSV output
-    csv_data = []
-    csv_headers = ['speaker', 'text', 'onset_time', 'offset_time']
-    
-    for speaker, text, onset_time, offset_time in turns:
-        # Add to CSV data
-        csv_data.append([speaker, text, f"{onset_time:.2f}", f"{offset_time:.2f}"])
-    
-    # Write to CSV file
     try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(csv_headers)
-            writer.writerows(csv_data)
-        print(f"Conversation turns written to {output_file}")
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            _write_turn_rows(csvfile, turns)
+        logger.info("Conversation turns written to %s", output_file)
+        return True
     except Exception as e:
-        print(f"Error writing CSV file: {e}")
+        logger.error("Error writing CSV file: %s", e)
+        return False
+
+
+def turns_to_csv_bytes(turns: List[Tuple[str, str, float, float]]) -> bytes:
+    """
+    Serialize conversation turns to the same CSV bytes write_turns_to_csv writes.
+    
+    Args:
+        turns: List of (speaker, text, onset_time, offset_time) tuples
+        
+    Returns:
+        UTF-8 encoded CSV content
+    """
+    buffer = io.StringIO(newline='')
+    _write_turn_rows(buffer, turns)
+    return buffer.getvalue().encode('utf-8')
 
 
 def parse_command_line_arguments() -> Tuple[str, Optional[List[str]], float]:
@@ -301,26 +671,21 @@ def parse_command_line_arguments() -> Tuple[str, Optional[List[str]], float]:
     Returns:
         Tuple of (directory_path, speaker_list, gap_threshold)
     """
-    # Set default values
-    directory = "."  # Current directory
-    speakers = None
-    gap_threshold = 1.0  # Default 1 second gap threshold
+    # Pad missing arguments with None and unpack once
+    directory_arg, speakers_arg, gap_arg = (sys.argv[1:] + [None, None, None])[:3]
     
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        directory = sys.argv[1]
+    directory = directory_arg or "."  # Current directory
     
-    if len(sys.argv) > 2:
-        # Parse speaker list (comma-separated)
-        speakers = [s.strip() for s in sys.argv[2].split(',')]
+    # Parse speaker list (comma-separated)
+    speakers = [s.strip() for s in speakers_arg.split(',')] if speakers_arg else None
     
-    if len(sys.argv) > 3:
-        # Parse gap threshold
+    # Parse gap threshold (default 1 second)
+    gap_threshold = 1.0
+    if gap_arg:
         try:
-            gap_threshold = float(sys.argv[3])
+            gap_threshold = float(gap_arg)
         except ValueError:
-            print(f"Warning: Invalid gap threshold '{sys.argv[3]}', using default 1.0")
-            gap_threshold = 1.0
+            logger.warning("Invalid gap threshold '%s', using default 1.0", gap_arg)
     
     return directory, speakers, gap_threshold
 
@@ -337,6 +702,12 @@ def main():
     5. Optionally merge short consecutive turns
     6. Write results to CSV with timestamps
     """
+    # Per-file progress is logged at DEBUG so batch runs stay quiet; LOGLEVEL=DEBUG shows it
+    log_level = getattr(logging, os.environ.get("LOGLEVEL", "INFO").upper(), None)
+    if not isinstance(log_level, int):
+        log_level = logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+    
     print("=== XML Transcription to Conversation Processor ===")
     print("NEW: Turns based on speech gaps, not speaker changes")
     
@@ -357,14 +728,14 @@ def main():
             if matches:
                 file_speaker_pairs.append((matches[0], speaker))
             else:
-                print(f"Warning: No XML file found for speaker {speaker}")
+                logger.warning("No XML file found for speaker %s", speaker)
     else:
         # Auto-discover files and speakers
         print("Auto-discovering XML files and speakers...")
         file_speaker_pairs = discover_xml_files_and_speakers(directory)
     
     if not file_speaker_pairs:
-        print("Error: No XML files found!")
+        logger.error("No XML files found!")
         sys.exit(1)
     
     print(f"Found {len(file_speaker_pairs)} speaker files:")
@@ -373,12 +744,12 @@ def main():
     
     # Step 1: Extract words with timestamps from all XML files
     print("\n=== Extracting words from XML files ===")
-    word_dict = build_chronological_word_dictionary(file_speaker_pairs)
-    print(f"Extracted {len(word_dict)} words total")
+    timeline = build_chronological_word_dictionary(file_speaker_pairs)
+    print(f"Extracted {len(timeline.words)} words total")
     
     # Step 2: Create turns based on speech gaps (NEW LOGIC)
     print(f"\n=== Creating turns based on {gap_threshold}s gap threshold ===")
-    turns = create_turns_with_gap_logic(word_dict, gap_threshold)
+    turns = create_turns_with_gap_logic(timeline, gap_threshold)
     print(f"Created {len(turns)} turns based on speech gaps")
     
     # Step 3: Optionally merge short consecutive turns from same speaker